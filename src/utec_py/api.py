@@ -1,55 +1,115 @@
 """Api class for Uhome/Utec API."""
 
-from enum import Enum
+import asyncio
+import itertools
 import json
 import logging
-from typing import Any, Dict, TypedDict
-from uuid import uuid4
+import secrets
+from typing import Any, Awaitable, Callable, Dict, Hashable
 
-from attr import dataclass
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from yarl import URL
 
 from .auth import AbstractAuth
-from .const import API_BASE_URL
+from .const import (
+    API_BASE_URL,
+    DEFAULT_TIMEOUT,
+    ApiHeader,
+    ApiNamespace,
+    ApiOperation,
+    ApiRequest,
+    DiscoveryResponse,
+    QueryResponse,
+)
 from .exceptions import ApiError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Parsed once so aiohttp does not re-parse the endpoint string per request
+API_URL = URL(API_BASE_URL)
+
+# Message IDs keep the 8-4-4-4-12 UUID layout: a random per-process prefix
+# followed by a counter, so no entropy is drawn per request.
+_MID_SEED = secrets.token_hex(10)
+_MID_PREFIX = f"{_MID_SEED[:8]}-{_MID_SEED[8:12]}-{_MID_SEED[12:16]}-{_MID_SEED[16:]}"
+_MID_COUNTER = itertools.count()
+
 
-class ApiNamespace(str, Enum):
-    DEVICE = "Uhome.Device"
-    USER = "Uhome.User"
-    CONFIGURE = "Uhome.Configure"
+def _next_message_id() -> str:
+    """Return a message ID unique to this process."""
+    return f"{_MID_PREFIX}-{next(_MID_COUNTER) & 0xFFFFFFFFFFFF:012x}"
 
 
-class ApiOperation(str, Enum):
-    DISCOVERY = "Discovery"
-    QUERY = "Query"
-    COMMAND = "Command"
-    SET = "Set"
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
 
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
 
-@dataclass
-class ApiHeader(TypedDict):
-    namespace: str
-    name: str
-    messageId: str
-    payloadVersion: str
+    _json_loads = json.loads
 
 
-@dataclass
-class ApiRequest(TypedDict):
-    header: ApiHeader
-    payload: dict | None
+def _create_session() -> ClientSession:
+    """Create a client session with a connector tuned for the U-Tec API."""
+    connector = TCPConnector(
+        limit=100, limit_per_host=20, keepalive_timeout=75, ttl_dns_cache=300
+    )
+    return ClientSession(
+        connector=connector, timeout=ClientTimeout(total=DEFAULT_TIMEOUT)
+    )
 
 
 class UHomeApi:
     """U-Home API client implementation."""
 
-    def __init__(self, Auth: AbstractAuth) -> None:
-        """Initialise the API."""
+    def __init__(self, Auth: AbstractAuth, max_concurrency: int = 100) -> None:
+        """Initialise the API.
+
+        Args:
+            Auth: AbstractAuth implementation used to make requests
+            max_concurrency: Maximum number of requests in flight at once
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
         self.auth = Auth
+        self.max_concurrency = max_concurrency
+        self._sem = asyncio.Semaphore(max_concurrency)
+        self._owned_session: ClientSession | None = None
+        self._inflight: dict[Hashable, asyncio.Task] = {}
 
-    async def async_create_request(
+    @classmethod
+    async def async_create(
+        cls,
+        auth_factory: Callable[[ClientSession], AbstractAuth],
+        max_concurrency: int = 100,
+    ) -> "UHomeApi":
+        """Create an API client that owns a long-lived, tuned client session.
+
+        Args:
+            auth_factory: Called with the new session, returns the auth to use
+            max_concurrency: Maximum number of requests in flight at once
+
+        The session is closed by close().
+        """
+        session = _create_session()
+        api = cls(auth_factory(session), max_concurrency)
+        api._owned_session = session
+        return api
+
+    async def close(self) -> None:
+        """Close the client session if it was created by async_create."""
+        if self._owned_session is not None:
+            await self._owned_session.close()
+            self._owned_session = None
+
+    def _create_request(
         self,
         namespace: ApiNamespace,
         operation: ApiOperation,
@@ -59,27 +119,70 @@ class UHomeApi:
         header: ApiHeader = {
             "namespace": namespace,
             "name": operation,
-            "messageId": str(uuid4()),
+            "messageId": _next_message_id(),
             "payloadVersion": "1",
         }
         return {"header": header, "payload": parameters}
 
-    async def _async_make_request(self, **kwargs):
-        """Make an authenticated API request."""
-        response = await self.auth.async_make_auth_request(
-            "POST", API_BASE_URL, **kwargs
-        )
-        try:
-            if response.status == 204:
-                return {}
-            elif response.status in (200, 201, 202):
-                return await response.json()
-            else:
-                error_text = await response.text()
-                logger.error(f"API error: {response.status} - {error_text}")
-                raise ApiError(response.status, error_text)
-        finally:
-            await response.release()
+    async def async_create_request(
+        self,
+        namespace: ApiNamespace,
+        operation: ApiOperation,
+        parameters: dict | None
+    ) -> ApiRequest:
+        """Create a standardised API request.
+
+        Kept for compatibility, internal callers use _create_request.
+        """
+        return self._create_request(namespace, operation, parameters)
+
+    async def _async_make_request(self, expect_body: bool = True, **kwargs):
+        """Make an authenticated API request.
+
+        Payloads are passed pre-serialised as ``data`` so that orjson (when
+        installed) is used for both encoding and decoding. When expect_body
+        is False a successful response body is read but not decoded.
+        """
+        async with self._sem:
+            response = await self.auth.async_make_auth_request(
+                "POST", API_URL, **kwargs
+            )
+            # The context releases the connection back to the pool on every path
+            async with response:
+                if response.status == 204:
+                    return {}
+                elif response.status in (200, 201, 202):
+                    # Always drained, an unread body stops the connection being reused
+                    body = await response.read()
+                    return _json_loads(body) if body and expect_body else {}
+                else:
+                    error_text = await response.text()
+                    logger.error(f"API error: {response.status} - {error_text}")
+                    raise ApiError(response.status, error_text)
+
+    async def _async_singleflight(
+        self, key: Hashable, request: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Run request, sharing the result with identical concurrent calls.
+
+        While a request for key is in flight, further calls with the same key
+        await that request instead of sending another one.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(request())
+            self._inflight[key] = task
+
+            def _done(finished: asyncio.Task) -> None:
+                if self._inflight.get(key) is finished:
+                    del self._inflight[key]
+                if not finished.cancelled():
+                    # Retrieved here in case every waiter was cancelled
+                    finished.exception()
+
+            task.add_done_callback(_done)
+        # Shielded so one cancelled caller does not abort the shared request
+        return await asyncio.shield(task)
 
     async def validate_auth(self) -> bool:
         """Validate authentication by making a test request."""
@@ -89,17 +192,24 @@ class UHomeApi:
         except ApiError:
             return False
 
-    async def discover_devices(self) -> Dict[str, Any]:
-        """Discover available devices."""
+    async def discover_devices(self) -> DiscoveryResponse:
+        """Discover available devices.
+
+        Concurrent calls share a single discovery request.
+        """
+        return await self._async_singleflight("discovery", self._async_discover)
+
+    async def _async_discover(self) -> DiscoveryResponse:
+        """Send a discovery request."""
         logger.debug("Discovering devices")
-        payload = await self.async_create_request(
+        payload = self._create_request(
             ApiNamespace.DEVICE, ApiOperation.DISCOVERY, {}
         )
-        return await self._async_make_request(json=payload)
+        return await self._async_make_request(data=_json_dumps(payload))
 
     async def get_device_state(
         self, device_ids: list, custom_data: dict | None
-    ) -> Dict[str, Any]:
+    ) -> QueryResponse:
         """Get device status - supports multiple devices at once and custom data."""
         devices = []
         for device_id in device_ids:
@@ -108,33 +218,48 @@ class UHomeApi:
                 device["custom_data"] = custom_data
             devices.append(device)
         params = {"devices": devices}
-        payload = await self.async_create_request(
+        payload = self._create_request(
             ApiNamespace.DEVICE, ApiOperation.QUERY, params
         )
-        return await self._async_make_request(json=payload)
+        return await self._async_make_request(data=_json_dumps(payload))
+
+    async def query_devices(self, device_ids: list[str]) -> QueryResponse:
+        """Query the state of several devices in a single request.
 
-    async def query_device(self, device_id: str):
-        """Query single device."""
-        device = [{"id": device_id}]
-        params = {"devices": device}
-        payload = await self.async_create_request(
+        Callers refreshing more than one device should prefer this over
+        query_device, as it costs one round trip regardless of device count.
+        """
+        params = {"devices": [{"id": device_id} for device_id in device_ids]}
+        payload = self._create_request(
             ApiNamespace.DEVICE, ApiOperation.QUERY, params
         )
-        logger.debug(
-            "Querying device with device ID %s and payload %s",
-            device_id,
-            json.dumps(payload, default=str),
+        data = _json_dumps(payload)
+        logger.debug("Querying devices %s with payload %s", device_ids, data)
+        return await self._async_make_request(data=data)
+
+    async def query_device(self, device_id: str) -> QueryResponse:
+        """Query single device.
+
+        Concurrent queries for the same device share a single request, a
+        command sent to the device stops later queries from joining it.
+        """
+        return await self._async_singleflight(
+            ("query", device_id), lambda: self.query_devices([device_id])
         )
-        return await self._async_make_request(json=payload)
 
     async def send_command(
         self,
         device_id: str,
         capability: str,
         command: str,
-        arguments: dict | None
+        arguments: dict | None,
+        expect_body: bool = True,
     ) -> Dict[str, Any]:
-        """Send command to device."""
+        """Send command to device.
+
+        Pass expect_body=False when the response is not needed, the call then
+        only checks the status code and returns an empty dict.
+        """
         command_data: dict[str, Any] = {
             "capability": capability,
             "name": command
@@ -144,16 +269,19 @@ class UHomeApi:
 
         params = {"devices": [{"id": device_id, "command": command_data}]}
 
-        payload = await self.async_create_request(
+        payload = self._create_request(
             ApiNamespace.DEVICE, ApiOperation.COMMAND, params
         )
+        data = _json_dumps(payload)
         logger.debug(
             "Sending Command %s to device %s, with payload %s",
             command,
             device_id,
-            json.dumps(payload, default=str),
+            data,
         )
-        return await self._async_make_request(json=payload)
+        # A query started before this command may return the old state
+        self._inflight.pop(("query", device_id), None)
+        return await self._async_make_request(expect_body, data=data)
 
     async def set_push_status(self, uri: str, access_token: str):
         """Register URI for push device updates.
@@ -163,8 +291,8 @@ class UHomeApi:
             access_token: OAuth2 access token sent by U-Tec with each push notification
         """
         params = {"configure": {"notification": {"access_token": access_token, "url": uri}}}
-        payload = await self.async_create_request(
+        payload = self._create_request(
             ApiNamespace.CONFIGURE, ApiOperation.SET, params
         )
         logger.debug("Setting push update url. URL: %s", uri)
-        return await self._async_make_request(json=payload)
+        return await self._async_make_request(data=_json_dumps(payload))
@@ -3,41 +3,139 @@
 # auth.py - OAuth2 implementation
 
 from abc import ABC, abstractmethod
+import asyncio
+import logging
+import time
+from types import MappingProxyType
 
 from aiohttp import ClientResponse, ClientSession
+from yarl import URL
+
+from .const import TOKEN_EXPIRY_MARGIN, TOKEN_STALE_MARGIN
+
+logger = logging.getLogger(__name__)
 
 
 class AbstractAuth(ABC):
     """Abstract Auth base for extension in integrations.
 
-    Takes an aiohttp clientsession for extending token management.
+    Takes an aiohttp clientsession for extending token management. The
+    session should be long-lived and must outlive every request made through
+    this auth, creating one per request discards pooled connections.
+    UHomeApi.async_create can create and close a tuned session instead.
 
     """
 
+    # Set by implementations that override async_fetch_access_token to report
+    # token lifetimes, the first token is then fetched through the cache too
+    cache_tokens: bool = False
+
     def __init__(self, websession: ClientSession) -> None:
         """Initialise auth class."""
         self.websession = websession
+        self._access_token: str | None = None
+        self._token_valid_until = 0.0
+        self._token_refreshed_at = 0.0
+        self._auth_headers: MappingProxyType[str, str] | None = None
+        self._auth_headers_token: str | None = None
+        self._refresh_task: asyncio.Task[str] | None = None
 
     @abstractmethod
     async def async_get_access_token(self) -> str:
         """Return a valid access token (refresh if needed)."""
 
+    async def async_fetch_access_token(self) -> tuple[str, float | None]:
+        """Return a new access token and its lifetime in seconds, if known.
+
+        Used to refresh a cached token. The default defers to
+        async_get_access_token and reports no lifetime, which suits
+        implementations that call cache_access_token themselves. Override it
+        and set cache_tokens to have this class cache every token.
+        """
+        return await self.async_get_access_token(), None
+
+    def cache_access_token(self, access_token: str, expires_in: float) -> None:
+        """Cache an access token for reuse until shortly before it expires.
+
+        Implementations may call this from async_get_access_token to seed the
+        cache, a cached token is used whether or not cache_tokens is set.
+        """
+        self._access_token = access_token
+        self._token_valid_until = (
+            time.monotonic() + expires_in - TOKEN_EXPIRY_MARGIN
+        )
+
+    def is_token_valid(self) -> bool:
+        """Return True if the cached access token has not expired."""
+        return (
+            self._access_token is not None
+            and time.monotonic() < self._token_valid_until
+        )
+
+    async def _async_refresh_token(self) -> str:
+        """Fetch a new access token and cache it if its lifetime is known."""
+        # Recorded before fetching so a failing endpoint is tried once per
+        # stale window rather than by every request
+        self._token_refreshed_at = time.monotonic()
+        access_token, expires_in = await self.async_fetch_access_token()
+        if expires_in is not None:
+            self.cache_access_token(access_token, expires_in)
+        return access_token
+
+    def _async_start_refresh(self) -> asyncio.Task[str]:
+        """Return the in-flight token refresh, starting one if needed."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._async_refresh_token())
+            self._refresh_task.add_done_callback(self._refresh_done)
+        return self._refresh_task
+
+    @staticmethod
+    def _refresh_done(task: asyncio.Task[str]) -> None:
+        """Log failures of refreshes that nobody awaited."""
+        if not task.cancelled() and (err := task.exception()) is not None:
+            logger.debug("Access token refresh failed: %s", err)
+
+    async def _async_access_token(self) -> str:
+        """Return the access token to use for a request.
+
+        Until a token is cached this is async_get_access_token, unless
+        cache_tokens is set. A cached token is fresh until TOKEN_STALE_MARGIN
+        seconds before it expires and is returned as is. A stale token is still returned, but a
+        background refresh is started unless one was already attempted since
+        the token went stale. Once expired, callers wait for the refresh.
+        Concurrent callers share a single in-flight refresh.
+        """
+        if self._access_token is not None:
+            now = time.monotonic()
+            if now < self._token_valid_until:
+                stale_from = self._token_valid_until - TOKEN_STALE_MARGIN
+                if now >= stale_from and self._token_refreshed_at < stale_from:
+                    self._async_start_refresh()
+                return self._access_token
+        elif not self.cache_tokens:
+            return await self.async_get_access_token()
+        # Shielded so one cancelled caller does not abort the shared refresh
+        return await asyncio.shield(self._async_start_refresh())
+
     async def async_make_auth_request(
-        self, method, host: str, **kwargs
+        self, method, host: str | URL, **kwargs
     ) -> ClientResponse:
         """Perfoms authenticated request using the clientsession passed through class init function."""
-        if headers := kwargs.pop("headers", {}):
-            headers = dict(headers)
-
-        headers.update(
-            {
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-            }
-        )
+        access_token = await self._async_access_token()
+        if self._auth_headers is None or access_token != self._auth_headers_token:
+            # Only rebuilt when the token changes, shared by reference otherwise
+            self._auth_headers = MappingProxyType(
+                {
+                    "Content-Type": "application/json",
+                    "Accept": "application/json",
+                    "authorization": f"Bearer {access_token}",
+                }
+            )
+            self._auth_headers_token = access_token
 
-        access_token = await self.async_get_access_token()
-        headers["authorization"] = f"Bearer {access_token}"
+        headers = self._auth_headers
+        if extra_headers := kwargs.pop("headers", None):
+            headers = {**extra_headers, **headers}
 
         return await self.websession.request(
             method,
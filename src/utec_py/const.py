@@ -7,6 +7,15 @@ AUTH_BASE_URL = "https://oauth.u-tec.com/authorize?"
 TOKEN_BASE_URL = "https://oauth.u-tec.com/token?"
 API_BASE_URL = "https://api.u-tec.com/action"
 
+# Total timeout in seconds for requests made on library owned sessions
+DEFAULT_TIMEOUT = 30
+
+# Seconds before expiry at which a cached access token is treated as invalid
+TOKEN_EXPIRY_MARGIN = 300
+
+# Seconds before a cached token expires at which it is refreshed in the background
+TOKEN_STALE_MARGIN = 180
+
 ATTR_HANDLE_TYPE = "handleType"
 ATTR_DEVICE_ID = "id"
 ATTR_NAME = "name"
@@ -18,21 +27,52 @@ ATTR_ATTRIBUTES = "attributes"
 class ApiNamespace(str, Enum):
     DEVICE = "Uhome.Device"
     USER = "Uhome.User"
+    CONFIGURE = "Uhome.Configure"
 
 
 class ApiOperation(str, Enum):
     DISCOVERY = "Discovery"
     QUERY = "Query"
     COMMAND = "Command"
+    SET = "Set"
 
 
 class ApiHeader(TypedDict):
     namespace: ApiNamespace
     name: ApiOperation
-    messageID: str
+    messageId: str
     payloadVersion: str
 
 
 class ApiRequest(TypedDict):
     header: ApiHeader
     payload: Optional[dict[str, Any]]
+
+
+class DeviceStateEntry(TypedDict):
+    capability: str
+    name: str
+    value: Any
+
+
+class DeviceStatePayload(TypedDict, total=False):
+    id: str
+    states: list[DeviceStateEntry]
+
+
+class QueryPayload(TypedDict):
+    devices: list[DeviceStatePayload]
+
+
+class QueryResponse(TypedDict, total=False):
+    header: ApiHeader
+    payload: QueryPayload
+
+
+class DiscoveryPayload(TypedDict):
+    devices: list[dict[str, Any]]
+
+
+class DiscoveryResponse(TypedDict, total=False):
+    header: ApiHeader
+    payload: DiscoveryPayload
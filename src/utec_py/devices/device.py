@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 import logging
-from typing import Any, Dict, Set
+from typing import Any, Callable, Dict, FrozenSet, Iterable
 
 from ..api import UHomeApi
 from ..exceptions import DeviceError
@@ -11,8 +11,12 @@ from .device_const import HANDLE_TYPE_CAPABILITIES, DeviceCategory, DeviceComman
 
 logger = logging.getLogger(__name__)
 
+_CATEGORY_LOOKUP: Dict[str, DeviceCategory] = {
+    category.value: category for category in DeviceCategory
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class DeviceInfo:
     """Class that represents device information in the U-Home API."""
 
@@ -35,6 +39,22 @@ class DeviceInfo:
 class BaseDevice:
     """Base class for all U-Home devices."""
 
+    __slots__ = (
+        "_api",
+        "_attributes",
+        "_category",
+        "_device_info",
+        "_discovery_data",
+        "_handle_type",
+        "_id",
+        "_last_update",
+        "_name",
+        "_state_cache",
+        "_state_data",
+        "_state_index",
+        "_supported_capabilities",
+    )
+
     def __init__(self, discovery_data: dict, api: UHomeApi) -> None:
         """Initialize the device with discovery data.
 
@@ -49,6 +69,8 @@ class BaseDevice:
         self._api = api
         self._discovery_data = discovery_data
         self._state_data: Dict | None = None
+        self._state_cache: Dict[str, Any] = {}
+        self._state_index: Dict[tuple[str, str], Any] = {}
         self._last_update: datetime | None = None
 
         # Extract required fields
@@ -56,16 +78,18 @@ class BaseDevice:
             self._id = discovery_data["id"]
             self._name = discovery_data["name"]
             self._handle_type = discovery_data["handleType"]
-            self._category = discovery_data.get("category", "unknown")
+            self._category = _CATEGORY_LOOKUP.get(
+                discovery_data.get("category"), DeviceCategory.UNKNOWN
+            )
 
             # Parse device info
             device_info_data = discovery_data.get("deviceInfo", {})
             self._device_info = DeviceInfo.from_dict(device_info_data)
 
             # Get attributes and capabilities
-            self._attributes = discovery_data.get("attributes", {})
+            self._attributes = discovery_data.get("attributes") or {}
             self._supported_capabilities = HANDLE_TYPE_CAPABILITIES.get(
-                self._handle_type, set()
+                self._handle_type, frozenset()
             )
 
             self._validate_capabilities()
@@ -75,6 +99,11 @@ class BaseDevice:
                 f"Missing required field in discovery data: {err}"
             ) from err
 
+    @property
+    def api(self) -> UHomeApi:
+        """Get the UHomeApi instance used by the device."""
+        return self._api
+
     @property
     def device_id(self) -> str:
         """Get the unique device ID."""
@@ -93,7 +122,7 @@ class BaseDevice:
     @property
     def category(self) -> DeviceCategory:
         """Get the device category."""
-        return DeviceCategory(self._category)
+        return self._category
 
     @property
     def manufacturer(self) -> str:
@@ -116,7 +145,7 @@ class BaseDevice:
         return self._device_info.serial_number
 
     @property
-    def supported_capabilities(self) -> Set[str]:
+    def supported_capabilities(self) -> FrozenSet[str]:
         """Get the set of supported capabilities."""
         return self._supported_capabilities
 
@@ -143,13 +172,29 @@ class BaseDevice:
             DeviceError: If device is missing required capabilities
 
         """
-        required_capabilities = HANDLE_TYPE_CAPABILITIES.get(self._handle_type, set())
+        required_capabilities = HANDLE_TYPE_CAPABILITIES.get(
+            self._handle_type, frozenset()
+        )
         if not required_capabilities.issubset(self._supported_capabilities):
             missing = required_capabilities - self._supported_capabilities
             raise DeviceError(
                 f"Device {self._id} missing required capabilities: {missing}"
             )
 
+    def _cached(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Return a value derived from state data, computed once per update.
+
+        Args:
+            key: Cache key, unique per derived value
+            compute: Callable producing the value from the current state
+
+        """
+        try:
+            return self._state_cache[key]
+        except KeyError:
+            value = self._state_cache[key] = compute()
+            return value
+
     def _get_state_value(self, capability: str, attribute: str) -> Any:
         """Get a specific state value from device state data.
 
@@ -165,22 +210,18 @@ class BaseDevice:
             logger.debug("No state data available for device %s", self.device_id)
             return None
 
-        states = self._state_data.get("states", [])
-
-        if not states:
-            logger.debug("Empty states array for device %s", self.device_id)
+        try:
+            value = self._state_index[(capability, attribute)]
+        except KeyError:
+            logger.debug(
+                "State %s.%s not found for device %s",
+                capability,
+                attribute,
+                self.device_id,
+            )
             return None
-
-        for state in states:
-            if state.get("capability") == capability and state.get("name") == attribute:
-                logger.debug(
-                    "Found %s.%s = %s", capability, attribute, state.get("value")
-                )
-                return state.get("value")
-        logger.debug(
-            "State %s.%s not found for device %s", capability, attribute, self.device_id
-        )
-        return None
+        logger.debug("Found %s.%s = %s", capability, attribute, value)
+        return value
 
     def get_state_data(self) -> dict:
         """Get the current device states in a standardized format."""
@@ -211,7 +252,11 @@ class BaseDevice:
         )
         try:
             await self._api.send_command(
-                self.device_id, command.capability, command.name, command.arguments
+                self.device_id,
+                command.capability,
+                command.name,
+                command.arguments,
+                expect_body=False,
             )
 
             self._last_update = datetime.now()
@@ -219,9 +264,32 @@ class BaseDevice:
         except Exception as err:
             raise DeviceError(f"Failed to send command to device: {err}") from err
 
+    def _set_state_data(self, state_data: dict) -> None:
+        """Replace the state data and drop values parsed from the old state."""
+        self._state_data = state_data
+        # Reversed so the first entry wins if a state is reported twice
+        self._state_index = {
+            (state.get("capability"), state.get("name")): state.get("value")
+            for state in reversed(state_data.get("states", []))
+        }
+        self._state_cache.clear()
+        self._last_update = datetime.now()
+
+    def apply_state(self, state_data: dict) -> None:
+        """Apply a device entry from a query response as the current state."""
+        self._set_state_data(state_data)
+        logger.debug(
+            "Updated device %s with data: %s",
+            self.device_id,
+            self._state_data,
+        )
+
     async def update(self) -> None:
         """Update device state data.
 
+        Concurrent updates of the same device share a single query, use
+        async_update_devices to refresh several devices in one request.
+
         Raises:
             DeviceError: If update fails
 
@@ -229,16 +297,8 @@ class BaseDevice:
         logger.debug("updating device %s", self.device_id)
         try:
             response = await self._api.query_device(self.device_id)
-            if response and "payload" in response:
-                devices = response["payload"].get("devices", [])
-                if devices:
-                    self._state_data = devices[0]
-                    logger.debug(
-                        "Updated device %s with data: %s",
-                        self.device_id,
-                        self._state_data,
-                    )
-                    self._last_update = datetime.now()
+            if devices := response.get("payload", {}).get("devices"):
+                self.apply_state(devices[0])
 
         except Exception as err:
             raise DeviceError(f"Failed to update device state: {err}") from err
@@ -246,13 +306,12 @@ class BaseDevice:
     async def update_state_data(self, push_data: dict ) -> Dict[str, Any] | None:
         """Update device data from push data"""
         if "states" in push_data:
-            self._state_data = push_data
+            self._set_state_data(push_data)
             logger.debug(
                 "Updated device %s with push data: %s",
                 self.device_id,
                 push_data
             )
-            self._last_update = datetime.now()
         else:
             logger.warning(
                 "Invalid push data format for device %s: %s",
@@ -284,3 +343,27 @@ class BaseDevice:
             f"type={self.handle_type}, "
             f"category={self.category})"
         )
+
+
+async def async_update_devices(api: UHomeApi, devices: Iterable[BaseDevice]) -> None:
+    """Update the state of several devices with a single query request.
+
+    Args:
+        api: UHomeApi instance used for the query
+        devices: Devices to update
+
+    Raises:
+        DeviceError: If the query fails
+
+    """
+    devices_by_id = {device.device_id: device for device in devices}
+    if not devices_by_id:
+        return
+    try:
+        response = await api.query_devices(list(devices_by_id))
+    except Exception as err:
+        raise DeviceError(f"Failed to update device states: {err}") from err
+
+    for state_data in response.get("payload", {}).get("devices", []):
+        if device := devices_by_id.get(state_data.get("id")):
+            device.apply_state(state_data)
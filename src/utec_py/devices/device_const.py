@@ -1,11 +1,11 @@
 """Device types and constants for U-Home API devices."""
 
 from dataclasses import dataclass
-from enum import Enum, IntEnum
-from typing import Any, Dict, Optional, Set
+from enum import IntEnum, StrEnum
+from typing import Any, Dict, FrozenSet, Optional
 
 
-class HandleType(str, Enum):
+class HandleType(StrEnum):
     """Device handle types supported by the API."""
 
     UTEC_LOCK = "utec-lock"
@@ -15,7 +15,7 @@ class HandleType(str, Enum):
     UTEC_SWITCH = "utec-switch"
 
 
-class DeviceCapability(str, Enum):
+class DeviceCapability(StrEnum):
     """Device capabilities supported by the API."""
 
     SWITCH = "st.switch"
@@ -30,7 +30,7 @@ class DeviceCapability(str, Enum):
     HEALTH_CHECK = "st.healthCheck"
 
 
-class DeviceCategory(str, Enum):
+class DeviceCategory(StrEnum):
     """Device categories as returned by the API."""
 
     LOCK = "SmartLock"
@@ -40,7 +40,7 @@ class DeviceCategory(str, Enum):
     UNKNOWN = "Unknown"
 
 
-class LockState(str, Enum):
+class LockState(StrEnum):
     """Lock state values from API."""
 
     LOCKED = "Locked"
@@ -60,7 +60,7 @@ class LockMode(IntEnum):
     LOCKED = 2
 
 
-class DoorState(str, Enum):
+class DoorState(StrEnum):
     """Door state values from API (st.doorSensor / sensorState attribute)."""
 
     CLOSED = "Closed"
@@ -71,7 +71,7 @@ class DoorState(str, Enum):
 # SwitchState is kept for reading state values returned by the API.
 # Commands use the command name directly ("on"/"off") with no arguments,
 # per the st.switch capability spec.
-class SwitchState(str, Enum):
+class SwitchState(StrEnum):
     """Switch state values returned by the API."""
 
     ON = "on"
@@ -79,7 +79,7 @@ class SwitchState(str, Enum):
     UNKNOWN = "Unknown"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeviceCommand:
     """Represents a command to be sent to a U-Home device."""
 
@@ -98,7 +98,7 @@ class DeviceCommand:
         return command_dict
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorState:
     """Represents color state of a light."""
 
@@ -116,8 +116,8 @@ class ColorState:
         return {"r": self.r, "g": self.g, "b": self.b}
 
 
-@dataclass
-class ColorTemperatureRange(int):
+@dataclass(slots=True)
+class ColorTemperatureRange:
     """Represents color temperature range for lights."""
 
     min: int  # Minimum temperature in Kelvin
@@ -142,36 +142,46 @@ class ColorTempRange(int):
 
 
 # Mapping of handle types to their required capabilities
-HANDLE_TYPE_CAPABILITIES: Dict[str, Set[str]] = {
-    HandleType.UTEC_LOCK: {
-        DeviceCapability.LOCK,
-        DeviceCapability.BATTERY_LEVEL,
-        DeviceCapability.LOCK_USER,
-        DeviceCapability.HEALTH_CHECK,
-    },
-    HandleType.UTEC_LOCK_SENSOR: {
-        DeviceCapability.LOCK,
-        DeviceCapability.BATTERY_LEVEL,
-        DeviceCapability.DOOR_SENSOR,
-        DeviceCapability.HEALTH_CHECK,
-    },
-    HandleType.UTEC_DIMMER: {
-        DeviceCapability.SWITCH,
-        DeviceCapability.BRIGHTNESS,
-        DeviceCapability.HEALTH_CHECK,
-    },
-    HandleType.UTEC_LIGHT_RGBAW: {
-        DeviceCapability.SWITCH,
-        DeviceCapability.BRIGHTNESS,
-        DeviceCapability.COLOR,
-        DeviceCapability.COLOR_TEMPERATURE,
-        DeviceCapability.HEALTH_CHECK,
-    },
-    HandleType.UTEC_SWITCH: {DeviceCapability.SWITCH, DeviceCapability.HEALTH_CHECK},
+HANDLE_TYPE_CAPABILITIES: Dict[str, FrozenSet[str]] = {
+    HandleType.UTEC_LOCK: frozenset(
+        {
+            DeviceCapability.LOCK,
+            DeviceCapability.BATTERY_LEVEL,
+            DeviceCapability.LOCK_USER,
+            DeviceCapability.HEALTH_CHECK,
+        }
+    ),
+    HandleType.UTEC_LOCK_SENSOR: frozenset(
+        {
+            DeviceCapability.LOCK,
+            DeviceCapability.BATTERY_LEVEL,
+            DeviceCapability.DOOR_SENSOR,
+            DeviceCapability.HEALTH_CHECK,
+        }
+    ),
+    HandleType.UTEC_DIMMER: frozenset(
+        {
+            DeviceCapability.SWITCH,
+            DeviceCapability.BRIGHTNESS,
+            DeviceCapability.HEALTH_CHECK,
+        }
+    ),
+    HandleType.UTEC_LIGHT_RGBAW: frozenset(
+        {
+            DeviceCapability.SWITCH,
+            DeviceCapability.BRIGHTNESS,
+            DeviceCapability.COLOR,
+            DeviceCapability.COLOR_TEMPERATURE,
+            DeviceCapability.HEALTH_CHECK,
+        }
+    ),
+    HandleType.UTEC_SWITCH: frozenset(
+        {DeviceCapability.SWITCH, DeviceCapability.HEALTH_CHECK}
+    ),
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceState:
     """Represents a device state in the API."""
 
@@ -187,7 +197,7 @@ class DeviceState:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceAttributes:
     """Device attributes from discovery data."""
 
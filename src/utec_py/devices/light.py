@@ -1,18 +1,38 @@
 """Abstraction layer for device interaction - Light."""
 # src/utec_py_LF2b2w/devices/light.py
 
+import asyncio
+import logging
 from typing import Tuple  # noqa: UP035
 
+from ..api import UHomeApi
 from .device import BaseDevice
 from .device_const import (
     BrightnessRange,
     ColorState,
     ColorTempRange,
+    DeviceAttributes,
     DeviceCapability,
     DeviceCommand,
     SwitchState,
 )
 
+logger = logging.getLogger(__name__)
+
+# Home Assistant feature names and the capability each one requires
+_FEATURE_CAPABILITIES = (
+    ("brightness", DeviceCapability.BRIGHTNESS),
+    ("color", DeviceCapability.COLOR),
+    ("color_temp", DeviceCapability.COLOR_TEMPERATURE),
+)
+
+# Accepted color temperature bounds in Kelvin when discovery reports none
+_COLOR_TEMP_RANGE = (ColorTempRange.MIN, ColorTempRange.MAX)
+
+# Argument-less commands are built once and shared by every Light
+_SWITCH_ON = DeviceCommand(capability=DeviceCapability.SWITCH, name="on")
+_SWITCH_OFF = DeviceCommand(capability=DeviceCapability.SWITCH, name="off")
+
 
 class Light(BaseDevice):
     """Represents a Light device in the U-Home API.
@@ -20,6 +40,46 @@ class Light(BaseDevice):
     Maps to Home Assistant's light platform.
     """
 
+    __slots__ = ("_color_temp_range", "_supported_features")
+
+    def __init__(self, discovery_data: dict, api: UHomeApi) -> None:
+        """Initialize the light and its capability derived features."""
+        super().__init__(discovery_data, api)
+        self._supported_features = frozenset(
+            feature
+            for feature, capability in _FEATURE_CAPABILITIES
+            if self.has_capability(capability)
+        )
+        self._color_temp_range = self._parse_color_temp_range()
+
+    def _parse_color_temp_range(self) -> Tuple[int, int]:
+        """Return the (min, max) color temperature reported at discovery.
+
+        Falls back to the generic ColorTempRange limits if the light reported
+        no range or an invalid one.
+        """
+        raw_range = self._attributes.get("colorTemperatureRange")
+        try:
+            temp_range = DeviceAttributes.from_dict(self._attributes).color_temp_range
+        except (KeyError, TypeError):
+            temp_range = None
+        else:
+            if temp_range is None:
+                return _COLOR_TEMP_RANGE
+            # type() rather than isinstance() so bools and floats are rejected
+            if (
+                type(temp_range.min) is int
+                and type(temp_range.max) is int
+                and temp_range.min <= temp_range.max
+            ):
+                return (temp_range.min, temp_range.max)
+        logger.warning(
+            "Invalid color temperature range for device %s: %s",
+            self.device_id,
+            raw_range,
+        )
+        return _COLOR_TEMP_RANGE
+
     @property
     def is_on(self) -> bool:
         """Get light state."""
@@ -41,7 +101,14 @@ class Light(BaseDevice):
 
     @property
     def rgb_color(self) -> Tuple[int, int, int] | None:
-        """Get RGB color."""
+        """Get RGB color.
+
+        Parsed once per state update and cached until the next one.
+        """
+        return self._cached("rgb_color", self._parse_rgb_color)
+
+    def _parse_rgb_color(self) -> Tuple[int, int, int] | None:
+        """Parse the RGB color from the current state."""
         color_data = self._get_state_value(DeviceCapability.COLOR, "color")
         if color_data:
             color = ColorState.from_dict(color_data)
@@ -49,47 +116,60 @@ class Light(BaseDevice):
         return None
 
     @property
-    def supported_features(self) -> set:
+    def supported_features(self) -> frozenset[str]:
         """Get supported features for Home Assistant."""
-        features = set()
-        if self.has_capability(DeviceCapability.BRIGHTNESS):
-            features.add("brightness")
-        if self.has_capability(DeviceCapability.COLOR):
-            features.add("color")
-        if self.has_capability(DeviceCapability.COLOR_TEMPERATURE):
-            features.add("color_temp")
-        return features
+        return self._supported_features
+
+    def _validate_color_temp(self, temp: int) -> None:
+        """Raise ValueError if temp is outside the light's range."""
+        min_temp, max_temp = self._color_temp_range
+        if not min_temp <= temp <= max_temp:
+            raise ValueError(
+                f"Color temperature must be between {min_temp}K and {max_temp}K"
+            )
+
+    @staticmethod
+    def _validate_rgb_color(red: int, green: int, blue: int) -> None:
+        """Raise ValueError if a component is outside 0-255."""
+        # Any bit above 0xFF is set for values over 255 and for negatives
+        if (red | green | blue) & ~0xFF:
+            raise ValueError("RGB values must be between 0 and 255")
 
     async def turn_on(self, **kwargs) -> None:
         """Turn on the light with optional attributes.
 
-        If an attribute command (brightness, color_temp, rgb_color) is provided,
+        If attribute commands (brightness, color_temp, rgb_color) are provided,
         the device turns on implicitly — no separate "on" command is needed.
-        Only send the explicit "on" command when no attributes are specified.
+        Brightness and the color are independent and are sent concurrently.
+        color_temp and rgb_color both set the color mode, so only one is
+        sent and color_temp takes precedence. Only send the explicit "on"
+        command when no attributes are specified. Arguments are validated
+        before any command is sent, so an invalid one sends nothing.
         """
+        if "color_temp" in kwargs:
+            self._validate_color_temp(kwargs["color_temp"])
+        elif "rgb_color" in kwargs:
+            self._validate_rgb_color(*kwargs["rgb_color"])
+
+        commands = []
         if "brightness" in kwargs:
-            await self.set_brightness(kwargs["brightness"])
-        elif "color_temp" in kwargs:
-            await self.set_color_temp(kwargs["color_temp"])
+            commands.append(self.set_brightness(kwargs["brightness"]))
+        if "color_temp" in kwargs:
+            commands.append(self.set_color_temp(kwargs["color_temp"]))
         elif "rgb_color" in kwargs:
-            await self.set_rgb_color(*kwargs["rgb_color"])
+            commands.append(self.set_rgb_color(*kwargs["rgb_color"]))
+
+        if commands:
+            await asyncio.gather(*commands)
         else:
-            command = DeviceCommand(
-                capability=DeviceCapability.SWITCH,
-                name="on",
-            )
-            await self.send_command(command)
+            await self.send_command(_SWITCH_ON)
 
     async def turn_off(self) -> None:
         """Turn off the light.
 
         Per st.switch capability spec, the command name is "off" with no arguments.
         """
-        command = DeviceCommand(
-            capability=DeviceCapability.SWITCH,
-            name="off",
-        )
-        await self.send_command(command)
+        await self.send_command(_SWITCH_OFF)
 
     async def set_brightness(self, brightness: int) -> None:
         """Set brightness level (1-100).
@@ -107,11 +187,12 @@ class Light(BaseDevice):
         await self.send_command(command)
 
     async def set_color_temp(self, temp: int) -> None:
-        """Set color temperature in Kelvin."""
-        if not ColorTempRange.MIN <= temp <= ColorTempRange.MAX:
-            raise ValueError(
-                f"Color temperature must be between {ColorTempRange.MIN}K and {ColorTempRange.MAX}K"
-            )
+        """Set color temperature in Kelvin.
+
+        Validated against the range the light reported at discovery, or the
+        generic ColorTempRange limits if it reported none.
+        """
+        self._validate_color_temp(temp)
         command = DeviceCommand(
             capability=DeviceCapability.COLOR_TEMPERATURE,
             name="temperature",
@@ -120,7 +201,8 @@ class Light(BaseDevice):
         await self.send_command(command)
 
     async def set_rgb_color(self, red: int, green: int, blue: int) -> None:
-        """Set RGB color."""
+        """Set RGB color, each component 0-255."""
+        self._validate_rgb_color(red, green, blue)
         color = ColorState(r=red, g=green, b=blue)
         command = DeviceCommand(
             capability=DeviceCapability.COLOR,
@@ -1,5 +1,6 @@
 """Abstraction layer for device interaction - Lock."""
 
+from ..api import UHomeApi
 from .device import BaseDevice
 from .device_const import (
     DeviceCapability,
@@ -10,6 +11,30 @@ from .device_const import (
     LockState,
 )
 
+# Argument-less commands are built once and shared by every Lock
+_LOCK = DeviceCommand(capability=DeviceCapability.LOCK, name="lock")
+_UNLOCK = DeviceCommand(capability=DeviceCapability.LOCK, name="unlock")
+
+_LOCK_STATES = {state.value: state for state in LockState}
+
+_DOOR_STATES = {state.value: state for state in DoorState}
+
+_LOCK_MODE_NAMES = {
+    LockMode.NORMAL: "Normal",
+    LockMode.PASSAGE: "Passage",
+    LockMode.LOCKED: "Locked",
+}
+
+_BATTERY_STATUS_NAMES = {
+    1: "Critically Low",
+    2: "Low",
+    3: "Medium",
+    4: "High",
+    5: "Full",
+}
+
+_BATTERY_PERCENTAGES = {1: 10, 2: 30, 3: 50, 4: 70, 5: 100}
+
 
 class Lock(BaseDevice):
     """Represents a Lock device in the U-Home API.
@@ -17,40 +42,42 @@ class Lock(BaseDevice):
     Maps to Home Assistant's lock platform.
     """
 
-    @property
-    def category(self) -> DeviceCategory:
-        """Get the device category."""
-        return DeviceCategory.LOCK
+    __slots__ = ("_has_door_sensor",)
+
+    # Every lock has the same category, a class attribute avoids a property call
+    category: DeviceCategory = DeviceCategory.LOCK
+
+    def __init__(self, discovery_data: dict, api: UHomeApi) -> None:
+        """Initialize the lock and its fixed door sensor support."""
+        super().__init__(discovery_data, api)
+        self._has_door_sensor = self.has_capability(DeviceCapability.DOOR_SENSOR)
 
     @property
     def lock_state(self) -> str:
         """Get the current lock state."""
         state = self._get_state_value(DeviceCapability.LOCK, "lockState")
-        return state if state else "Unknown"
+        # Values outside LockState are passed through unchanged
+        return _LOCK_STATES.get(state, state or LockState.UNKNOWN)
 
     @property
     def has_door_sensor(self) -> bool:
         """Check if the lock has a door sensor capability."""
-        return self.has_capability(DeviceCapability.DOOR_SENSOR)
+        return self._has_door_sensor
 
     @property
     def door_state(self) -> str | None:
         """Get the door state if door sensor is present."""
-        if not self.has_door_sensor:
+        if not self._has_door_sensor:
             return None
         # API attribute name is "sensorState" (lowercase s)
-        return self._get_state_value(DeviceCapability.DOOR_SENSOR, "sensorState")
+        state = self._get_state_value(DeviceCapability.DOOR_SENSOR, "sensorState")
+        return _DOOR_STATES.get(state, state)
 
     @property
     def lock_mode(self) -> str | None:
         """Get the current lock mode."""
         state = self._get_state_value(DeviceCapability.LOCK, "lockMode")
-        lock_mode_map = {
-            LockMode.NORMAL: "Normal",
-            LockMode.PASSAGE: "Passage",
-            LockMode.LOCKED: "Locked",
-        }
-        return lock_mode_map.get(state)
+        return _LOCK_MODE_NAMES.get(state)
 
     @property
     def is_locked(self) -> bool:
@@ -67,7 +94,7 @@ class Lock(BaseDevice):
     @property
     def is_door_open(self) -> bool | None:
         """Check if the door is open."""
-        if not self.has_door_sensor:
+        if not self._has_door_sensor:
             return None
         return self.door_state == DoorState.OPEN
 
@@ -75,14 +102,7 @@ class Lock(BaseDevice):
     def battery_status(self) -> str | None:
         """Get the current battery level as a string."""
         batt_level = self._get_state_value(DeviceCapability.BATTERY_LEVEL, "level")
-        battery_states = {
-            1: "Critically Low",
-            2: "Low",
-            3: "Medium",
-            4: "High",
-            5: "Full",
-        }
-        return battery_states.get(batt_level)
+        return _BATTERY_STATUS_NAMES.get(batt_level)
 
     @property
     def battery_level(self) -> int | None:
@@ -90,15 +110,12 @@ class Lock(BaseDevice):
         level = self._get_state_value(DeviceCapability.BATTERY_LEVEL, "level")
         if level is None:
             return None
-        batt_map = {1: 10, 2: 30, 3: 50, 4: 70, 5: 100}
-        return batt_map.get(level, 0)
+        return _BATTERY_PERCENTAGES.get(level, 0)
 
     async def lock(self) -> None:
         """Lock the device."""
-        command = DeviceCommand(capability=DeviceCapability.LOCK, name="lock")
-        await self.send_command(command)
+        await self.send_command(_LOCK)
 
     async def unlock(self) -> None:
         """Unlock the device."""
-        command = DeviceCommand(capability=DeviceCapability.LOCK, name="unlock")
-        await self.send_command(command)
+        await self.send_command(_UNLOCK)
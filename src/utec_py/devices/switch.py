@@ -5,6 +5,10 @@
 from .device import BaseDevice
 from .device_const import DeviceCapability, DeviceCommand, SwitchState
 
+# Argument-less commands are built once and shared by every Switch
+_SWITCH_ON = DeviceCommand(capability=DeviceCapability.SWITCH, name="on")
+_SWITCH_OFF = DeviceCommand(capability=DeviceCapability.SWITCH, name="off")
+
 
 class Switch(BaseDevice):
     """Represents a Switch device in the U-Home API.
@@ -12,6 +16,8 @@ class Switch(BaseDevice):
     Maps to Home Assistant's switch platform.
     """
 
+    __slots__ = ()
+
     @property
     def is_on(self) -> bool:
         """Get switch state."""
@@ -28,19 +34,11 @@ class Switch(BaseDevice):
 
         Per st.switch capability spec, the command name is "on" with no arguments.
         """
-        command = DeviceCommand(
-            capability=DeviceCapability.SWITCH,
-            name="on",
-        )
-        await self.send_command(command)
+        await self.send_command(_SWITCH_ON)
 
     async def turn_off(self) -> None:
         """Turn off the switch.
 
         Per st.switch capability spec, the command name is "off" with no arguments.
         """
-        command = DeviceCommand(
-            capability=DeviceCapability.SWITCH,
-            name="off",
-        )
-        await self.send_command(command)
+        await self.send_command(_SWITCH_OFF)
@@ -1 +1,21 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
 pytest_plugins = ['pytest_asyncio']
+
+
+@pytest.fixture
+def make_mock_auth():
+    """Return a factory for auth mocks answering every request with body."""
+
+    def _make(body=b'{"payload": {"devices": []}}', status=200):
+        mock_response = MagicMock(status=status)
+        mock_response.read = AsyncMock(return_value=body)
+        mock_response.text = AsyncMock(return_value=body.decode())
+
+        mock_auth = MagicMock()
+        mock_auth.async_make_auth_request = AsyncMock(return_value=mock_response)
+        return mock_auth
+
+    return _make
@@ -0,0 +1,174 @@
+# test_api.py
+# Test Command python -m pytest tests/
+import asyncio
+import importlib
+import json
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from utec_py import api as api_module
+from utec_py.api import UHomeApi
+
+
+def _sent_payload(mock_auth, call=-1):
+    return json.loads(mock_auth.async_make_auth_request.call_args_list[call].kwargs["data"])
+
+
+@pytest.mark.asyncio
+async def test_query_devices_single_request(make_mock_auth):
+    mock_auth = make_mock_auth()
+    api = UHomeApi(mock_auth)
+
+    await api.query_devices(["1", "2", "3"])
+
+    assert mock_auth.async_make_auth_request.await_count == 1
+    payload = _sent_payload(mock_auth)
+    assert payload["header"]["name"] == "Query"
+    assert payload["payload"] == {"devices": [{"id": "1"}, {"id": "2"}, {"id": "3"}]}
+
+
+@pytest.mark.asyncio
+async def test_query_device_uses_batch_form(make_mock_auth):
+    mock_auth = make_mock_auth(b'{"payload": {"devices": [{"id": "1"}]}}')
+    api = UHomeApi(mock_auth)
+
+    response = await api.query_device("1")
+
+    assert response == {"payload": {"devices": [{"id": "1"}]}}
+    assert _sent_payload(mock_auth)["payload"] == {"devices": [{"id": "1"}]}
+
+
+@pytest.mark.asyncio
+async def test_message_ids_are_unique(make_mock_auth):
+    mock_auth = make_mock_auth()
+    api = UHomeApi(mock_auth)
+
+    await api.discover_devices()
+    await api.discover_devices()
+
+    first = _sent_payload(mock_auth, 0)["header"]["messageId"]
+    second = _sent_payload(mock_auth, 1)["header"]["messageId"]
+    assert first != second
+    assert [len(part) for part in first.split("-")] == [8, 4, 4, 4, 12]
+
+
+@pytest.mark.asyncio
+async def test_send_command_without_body(make_mock_auth):
+    mock_auth = make_mock_auth(b'{"payload": {}}')
+    api = UHomeApi(mock_auth)
+
+    response = await api.send_command("1", "st.switch", "on", None, expect_body=False)
+
+    assert response == {}
+    mock_response = mock_auth.async_make_auth_request.return_value
+    mock_response.read.assert_awaited_once()
+    mock_response.__aexit__.assert_awaited_once()
+    assert _sent_payload(mock_auth)["payload"] == {
+        "devices": [{"id": "1", "command": {"capability": "st.switch", "name": "on"}}]
+    }
+
+
+@pytest.mark.asyncio
+async def test_async_create_owns_session():
+    sessions = []
+
+    def auth_factory(session):
+        sessions.append(session)
+        return MagicMock(websession=session)
+
+    api = await UHomeApi.async_create(auth_factory)
+    assert api.auth.websession is sessions[0]
+    assert not sessions[0].closed
+
+    await api.close()
+    assert sessions[0].closed
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_limits_in_flight_requests(make_mock_auth):
+    in_flight = 0
+    peak = 0
+    mock_auth = make_mock_auth()
+    mock_response = mock_auth.async_make_auth_request.return_value
+
+    async def make_request(*args, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return mock_response
+
+    mock_auth.async_make_auth_request.side_effect = make_request
+    api = UHomeApi(mock_auth, max_concurrency=2)
+
+    await asyncio.gather(*(api.query_device(str(i)) for i in range(6)))
+
+    assert peak == 2
+
+
+def test_max_concurrency_must_be_positive():
+    with pytest.raises(ValueError):
+        UHomeApi(MagicMock(), max_concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_queries_for_same_device_are_coalesced(make_mock_auth):
+    mock_auth = make_mock_auth(b'{"payload": {"devices": [{"id": "1"}]}}')
+    api = UHomeApi(mock_auth)
+
+    responses = await asyncio.gather(*(api.query_device("1") for _ in range(5)))
+
+    assert mock_auth.async_make_auth_request.await_count == 1
+    assert all(response == responses[0] for response in responses)
+
+    await api.query_device("1")
+    assert mock_auth.async_make_auth_request.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_query_after_command_does_not_join_earlier_query(make_mock_auth):
+    mock_auth = make_mock_auth(b'{"payload": {"devices": [{"id": "1"}]}}')
+    api = UHomeApi(mock_auth)
+
+    before = asyncio.ensure_future(api.query_device("1"))
+    await asyncio.sleep(0)
+    await api.send_command("1", "st.switch", "on", None)
+    await api.query_device("1")
+
+    await before
+    assert mock_auth.async_make_auth_request.await_count == 3
+    assert _sent_payload(mock_auth)["header"]["name"] == "Query"
+
+
+@pytest.mark.asyncio
+async def test_repeated_commands_are_all_sent(make_mock_auth):
+    mock_auth = make_mock_auth(b"", status=204)
+    api = UHomeApi(mock_auth)
+
+    await asyncio.gather(
+        *(api.send_command("1", "st.switch", name, None) for name in ("on", "off", "on"))
+    )
+
+    sent = [_sent_payload(mock_auth, i)["payload"]["devices"][0]["command"]["name"] for i in range(3)]
+    assert sent == ["on", "off", "on"]
+
+
+@pytest.mark.asyncio
+async def test_stdlib_json_fallback(monkeypatch, make_mock_auth):
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    fallback = importlib.reload(api_module)
+    try:
+        assert fallback.orjson is None
+        mock_auth = make_mock_auth(b'{"payload": {"devices": [{"id": "1"}]}}')
+
+        response = await fallback.UHomeApi(mock_auth).query_devices(["1"])
+
+        assert response == {"payload": {"devices": [{"id": "1"}]}}
+        assert isinstance(mock_auth.async_make_auth_request.call_args.kwargs["data"], bytes)
+        assert _sent_payload(mock_auth)["payload"] == {"devices": [{"id": "1"}]}
+    finally:
+        monkeypatch.undo()
+        importlib.reload(api_module)
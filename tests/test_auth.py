@@ -0,0 +1,195 @@
+# test_auth.py
+# Test Command python -m pytest tests/
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from utec_py.auth import AbstractAuth
+from utec_py.const import TOKEN_EXPIRY_MARGIN
+
+
+class CountingAuth(AbstractAuth):
+    """Auth implementation that counts token fetches."""
+
+    cache_tokens = True
+
+    def __init__(self, expires_in=3600):
+        super().__init__(MagicMock(request=AsyncMock()))
+        self.expires_in = expires_in
+        self.calls = 0
+
+    async def async_get_access_token(self) -> str:
+        return (await self.async_fetch_access_token())[0]
+
+    async def async_fetch_access_token(self) -> tuple[str, float]:
+        self.calls += 1
+        await asyncio.sleep(0)
+        return f"token_{self.calls}", self.expires_in
+
+
+class FailingAuth(CountingAuth):
+    """Auth implementation whose token endpoint always fails."""
+
+    async def async_fetch_access_token(self) -> tuple[str, float]:
+        self.calls += 1
+        raise RuntimeError("token endpoint unavailable")
+
+
+class SeedingAuth(AbstractAuth):
+    """Auth implementation that seeds the cache itself."""
+
+    def __init__(self):
+        super().__init__(MagicMock())
+        self.calls = 0
+
+    async def async_get_access_token(self) -> str:
+        self.calls += 1
+        token = f"token_{self.calls}"
+        self.cache_access_token(token, 3600)
+        return token
+
+
+class UncachedAuth(AbstractAuth):
+    """Auth implementation that does not cache tokens."""
+
+    def __init__(self):
+        super().__init__(MagicMock())
+        self.calls = 0
+
+    async def async_get_access_token(self) -> str:
+        self.calls += 1
+        return "token"
+
+
+# Fixtures
+@pytest.fixture
+def auth():
+    return CountingAuth()
+
+
+def _sent_headers(auth, call=-1):
+    return auth.websession.request.call_args_list[call].kwargs["headers"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_refresh(auth):
+    tokens = await asyncio.gather(*(auth._async_access_token() for _ in range(10)))
+
+    assert tokens == ["token_1"] * 10
+    assert auth.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_fresh_token_is_cached(auth):
+    assert await auth._async_access_token() == "token_1"
+    assert await auth._async_access_token() == "token_1"
+    assert auth.calls == 1
+    assert auth.is_token_valid()
+
+
+@pytest.mark.asyncio
+async def test_stale_token_refreshes_in_background(auth):
+    auth.cache_access_token("stale_token", TOKEN_EXPIRY_MARGIN + 60)
+
+    assert await auth._async_access_token() == "stale_token"
+    await auth._refresh_task
+
+    assert auth.calls == 1
+    assert await auth._async_access_token() == "token_1"
+
+
+@pytest.mark.asyncio
+async def test_expired_token_blocks_on_refresh(auth):
+    auth.cache_access_token("expired_token", 0)
+
+    assert not auth.is_token_valid()
+    assert await auth._async_access_token() == "token_1"
+
+
+@pytest.mark.asyncio
+async def test_stale_window_starts_one_refresh(auth):
+    # The fetched token is itself stale, it must not trigger another refresh
+    auth.expires_in = TOKEN_EXPIRY_MARGIN + 60
+    auth.cache_access_token("stale_token", TOKEN_EXPIRY_MARGIN + 60)
+
+    for _ in range(20):
+        await auth._async_access_token()
+        await asyncio.sleep(0)
+
+    assert auth.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_is_not_retried_in_stale_window():
+    auth = FailingAuth()
+    auth.cache_access_token("stale_token", TOKEN_EXPIRY_MARGIN + 60)
+
+    for _ in range(20):
+        assert await auth._async_access_token() == "stale_token"
+        await asyncio.sleep(0)
+
+    assert auth.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_seeded_token_is_cached():
+    auth = SeedingAuth()
+
+    for _ in range(3):
+        assert await auth._async_access_token() == "token_1"
+    assert auth.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_seeded_token_is_refreshed():
+    auth = SeedingAuth()
+    auth.cache_access_token("expired_token", 0)
+
+    assert await auth._async_access_token() == "token_1"
+    assert await auth._async_access_token() == "token_1"
+    assert auth.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_uncached_auth_fetches_token_directly():
+    auth = UncachedAuth()
+
+    assert await auth._async_access_token() == "token"
+    assert await auth._async_access_token() == "token"
+    assert auth.calls == 2
+    assert auth._refresh_task is None
+
+
+@pytest.mark.asyncio
+async def test_auth_headers_reused_while_token_unchanged(auth):
+    await auth.async_make_auth_request("POST", "https://example.com")
+    await auth.async_make_auth_request("POST", "https://example.com")
+
+    assert _sent_headers(auth, 0) is _sent_headers(auth, 1)
+    assert _sent_headers(auth)["authorization"] == "Bearer token_1"
+
+
+@pytest.mark.asyncio
+async def test_auth_headers_rebuilt_after_token_change(auth):
+    await auth.async_make_auth_request("POST", "https://example.com")
+    auth.cache_access_token("token_new", 3600)
+    await auth.async_make_auth_request("POST", "https://example.com")
+
+    assert _sent_headers(auth, 0) is not _sent_headers(auth, 1)
+    assert _sent_headers(auth, 0)["authorization"] == "Bearer token_1"
+    assert _sent_headers(auth, 1)["authorization"] == "Bearer token_new"
+
+
+@pytest.mark.asyncio
+async def test_caller_headers_do_not_override_authorization(auth):
+    await auth.async_make_auth_request(
+        "POST",
+        "https://example.com",
+        headers={"authorization": "Bearer other", "X-Request": "1"},
+    )
+
+    headers = _sent_headers(auth)
+    assert headers["authorization"] == "Bearer token_1"
+    assert headers["X-Request"] == "1"
+    assert "X-Request" not in auth._auth_headers
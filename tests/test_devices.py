@@ -0,0 +1,193 @@
+# test_devices.py
+# Test Command python -m pytest tests/
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from utec_py.api import UHomeApi
+from utec_py.devices.device import async_update_devices
+from utec_py.devices.light import Light
+from utec_py.devices.lock import Lock
+from utec_py.devices.switch import Switch
+
+
+# Fixtures
+@pytest.fixture
+def mock_api():
+    api = MagicMock()
+    api.send_command = AsyncMock(return_value={})
+    return api
+
+
+@pytest.fixture
+def rgb_light(mock_api):
+    return Light(_discovery("1", "utec-light-rgbaw-br"), mock_api)
+
+
+def _discovery(device_id, handle_type, **fields):
+    return {"id": device_id, "name": f"Device {device_id}", "handleType": handle_type, **fields}
+
+
+def _state(device_id, value):
+    return {
+        "id": device_id,
+        "states": [{"capability": "st.switch", "name": "switch", "value": value}],
+    }
+
+
+@pytest.mark.asyncio
+async def test_update_devices_single_query():
+    api = MagicMock()
+    api.query_devices = AsyncMock(
+        return_value={"payload": {"devices": [_state("2", "off"), _state("1", "on")]}}
+    )
+    light = Light(_discovery("1", "utec-dimmer"), api)
+    switch = Switch(_discovery("2", "utec-switch"), api)
+
+    await async_update_devices(api, [light, switch])
+
+    api.query_devices.assert_awaited_once_with(["1", "2"])
+    assert light.is_on
+    assert not switch.is_on
+
+
+@pytest.mark.asyncio
+async def test_rgb_color_cache_cleared_on_push_update(rgb_light):
+    color_state = {"capability": "st.color", "name": "color"}
+
+    rgb_light.apply_state({"id": "1", "states": [{**color_state, "value": {"r": 1, "g": 2, "b": 3}}]})
+    assert rgb_light.rgb_color == (1, 2, 3)
+
+    await rgb_light.update_state_data(
+        {"id": "1", "states": [{**color_state, "value": {"r": 4, "g": 5, "b": 6}}]}
+    )
+    assert rgb_light.rgb_color == (4, 5, 6)
+
+
+def test_state_lookup_first_entry_wins():
+    switch = Switch(_discovery("2", "utec-switch"), None)
+    switch.apply_state(
+        {
+            "id": "2",
+            "states": [
+                {"capability": "st.switch", "name": "switch", "value": "on"},
+                {"capability": "st.switch", "name": "switch", "value": "off"},
+                {"capability": "st.healthCheck", "name": "status", "value": "Online"},
+            ],
+        }
+    )
+
+    assert switch.is_on
+    assert switch._get_state_value("st.healthCheck", "status") == "Online"
+    assert switch._get_state_value("st.lock", "lockState") is None
+
+
+@pytest.mark.asyncio
+async def test_turn_on_sends_brightness_and_one_color(mock_api, rgb_light):
+    await rgb_light.turn_on(brightness=40, color_temp=3000, rgb_color=(1, 2, 3))
+
+    sent = {call.args[2]: call.args[3] for call in mock_api.send_command.await_args_list}
+    assert sent == {"setLevel": {"level": 40}, "temperature": {"value": 3000}}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"color_temp": 100}, {"rgb_color": (300, 0, 0)}],
+)
+async def test_turn_on_invalid_argument_sends_nothing(mock_api, rgb_light, kwargs):
+    with pytest.raises(ValueError):
+        await rgb_light.turn_on(brightness=50, **kwargs)
+
+    mock_api.send_command.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_turn_on_without_attributes(mock_api, rgb_light):
+    await rgb_light.turn_on()
+
+    mock_api.send_command.assert_awaited_once()
+    assert mock_api.send_command.await_args.args[1:3] == ("st.switch", "on")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_updates_share_one_query(make_mock_auth):
+    body = {"payload": {"devices": [_state("1", "on")]}}
+    mock_auth = make_mock_auth(json.dumps(body).encode())
+    api = UHomeApi(mock_auth)
+    light = Light(_discovery("1", "utec-dimmer"), api)
+
+    await asyncio.gather(light.update(), light.update(), light.update())
+
+    assert mock_auth.async_make_auth_request.await_count == 1
+    assert light.is_on
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("rgb", [(256, 0, 0), (0, -1, 0), (0, 0, 1000)])
+async def test_set_rgb_color_rejects_out_of_range(mock_api, rgb_light, rgb):
+    with pytest.raises(ValueError):
+        await rgb_light.set_rgb_color(*rgb)
+    mock_api.send_command.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_set_color_temp_uses_discovered_range(mock_api):
+    light = Light(
+        _discovery(
+            "1",
+            "utec-light-rgbaw-br",
+            attributes={"colorTemperatureRange": {"min": 2700, "max": 6500}},
+        ),
+        mock_api,
+    )
+
+    with pytest.raises(ValueError, match="2700K and 6500K"):
+        await light.set_color_temp(2000)
+
+    await light.set_color_temp(6500)
+    mock_api.send_command.assert_awaited_once()
+
+
+@pytest.mark.parametrize(
+    "temp_range",
+    [
+        {"min": 2700},
+        {"min": 6500, "max": 2700},
+        {"min": "2700", "max": "6500"},
+        None,
+    ],
+)
+def test_invalid_color_temp_range_uses_generic_limits(mock_api, temp_range):
+    light = Light(
+        _discovery(
+            "1",
+            "utec-light-rgbaw-br",
+            attributes={"colorTemperatureRange": temp_range},
+        ),
+        mock_api,
+    )
+
+    assert light._color_temp_range == (2000, 9000)
+
+
+def test_null_attributes_use_generic_color_temp_limits(mock_api):
+    light = Light(_discovery("1", "utec-light-rgbaw-br", attributes=None), mock_api)
+
+    assert light.attributes == {}
+    assert light._color_temp_range == (2000, 9000)
+
+
+def test_lock_door_sensor_from_handle_type(mock_api):
+    lock = Lock(_discovery("1", "utec-lock"), mock_api)
+    sensor_lock = Lock(_discovery("2", "utec-lock-sensor"), mock_api)
+    sensor_lock.apply_state(
+        {"id": "2", "states": [{"capability": "st.doorSensor", "name": "sensorState", "value": "Open"}]}
+    )
+
+    assert not lock.has_door_sensor
+    assert lock.door_state is None
+    assert sensor_lock.has_door_sensor
+    assert sensor_lock.is_door_open